@@ -14,13 +14,21 @@ Output:
 - data/candidate_set.json (~800-1000 unique locations)
 """
 
+import codecs
 import json
 import math
 from pathlib import Path
-from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from typing import Optional
 from datetime import datetime, timezone
 
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
 # Paths
 DATA_DIR = Path(__file__).parent.parent / "data"
 GROUND_NODES_FILE = DATA_DIR / "all_ground_nodes_backup.json"
@@ -30,6 +38,8 @@ OUTPUT_FILE = DATA_DIR / "candidate_set.json"
 # Deduplication threshold (km)
 PROXIMITY_THRESHOLD_KM = 50.0
 
+EARTH_RADIUS_KM = 6371.0
+
 # Zone definitions (longitude ranges)
 ZONES = {
     "AMERICAS": {"lon_min": -180, "lon_max": -30, "quota": 72},
@@ -38,7 +48,7 @@ ZONES = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class Candidate:
     """A candidate ground station location."""
     id: str
@@ -60,20 +70,100 @@ class Candidate:
     # Merged from both (if deduped)
     merged_sources: Optional[list] = None
 
+    # Cached trig for deduplication (not serialized)
+    _lat_rad: float = field(default=0.0, init=False, repr=False, compare=False)
+    _lon_rad: float = field(default=0.0, init=False, repr=False, compare=False)
+    _cos_lat: float = field(default=0.0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._lat_rad = math.radians(self.latitude)
+        self._lon_rad = math.radians(self.longitude)
+        self._cos_lat = math.cos(self._lat_rad)
+
+    def to_dict(self) -> dict:
+        """Populated serializable fields, without the cached trig."""
+        d = {
+            "id": self.id,
+            "name": self.name,
+            "latitude": self.latitude,
+            "longitude": self.longitude,
+            "zone": self.zone,
+            "source": self.source,
+        }
+        if self.tier is not None:
+            d["tier"] = self.tier
+        if self.demand_gbps is not None:
+            d["demand_gbps"] = self.demand_gbps
+        if self.weather_score is not None:
+            d["weather_score"] = self.weather_score
+        if self.cable_count is not None:
+            d["cable_count"] = self.cable_count
+        if self.cables is not None:
+            d["cables"] = self.cables
+        if self.merged_sources is not None:
+            d["merged_sources"] = self.merged_sources
+        return d
+
+
+def _require_array(events, key: str, message: str):
+    """Pass ijson events through, raising once exhausted if `key` held no array."""
+    found = False
+    for event in events:
+        if event[0] == key and event[1] == "start_array":
+            found = True
+        yield event
+    if not found:
+        raise ValueError(message)
+
+
+def iter_json_array(path: Path, key: Optional[str] = None):
+    """
+    Yield the items of a top-level JSON array, or of the array under `key`
+    when the document is an object. Streams with ijson when installed so
+    the raw records are never all held in memory at once. Raises ValueError
+    for any other document shape.
+    """
+    expected = f"{path}: expected a JSON array" + (f" or an object with '{key}'" if key else "")
+    if HAS_IJSON:
+        with open(path, "rb") as f:
+            # Skip a UTF-8 BOM and any leading whitespace to find the first token
+            start = len(codecs.BOM_UTF8) if f.read(len(codecs.BOM_UTF8)) == codecs.BOM_UTF8 else 0
+            f.seek(start)
+            first = b""
+            while not first and (chunk := f.read(4096)):
+                first = chunk.lstrip()[:1]
+            f.seek(start)
+            events = ijson.parse(f, use_float=True)
+            if first == b"[":
+                yield from ijson.items(events, "item")
+            elif first == b"{" and key:
+                yield from ijson.items(_require_array(events, key, expected), f"{key}.item")
+            else:
+                raise ValueError(expected)
+        return
+
+    with open(path, encoding="utf-8-sig") as f:
+        data = json.load(f)
+    if key and isinstance(data, dict) and key in data:
+        data = data[key]
+    if not isinstance(data, list):
+        raise ValueError(expected)
+    yield from data
 
-def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    """Calculate great-circle distance between two points in km."""
-    R = 6371.0  # Earth radius in km
-
-    lat1_rad = math.radians(lat1)
-    lat2_rad = math.radians(lat2)
-    dlat = math.radians(lat2 - lat1)
-    dlon = math.radians(lon2 - lon1)
-
-    a = math.sin(dlat/2)**2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon/2)**2
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
 
-    return R * c
+def grid_lon_cells(row: int, cell_deg: float, threshold_km: float) -> int:
+    """
+    Number of longitude cells in a latitude row of the dedup grid.
+    Cells are sized so any point within threshold_km of this row (or
+    its neighbouring rows) lies at most one cell away.
+    """
+    max_abs_lat = min(90.0, (abs(row) + 2) * cell_deg)
+    cos_lat = math.cos(math.radians(max_abs_lat))
+    s = math.sin(threshold_km / (2 * EARTH_RADIUS_KM))
+    if cos_lat <= s:
+        return 1  # Polar rows: a single cell spans all longitudes
+    width_deg = math.degrees(2 * math.asin(s / cos_lat))
+    return max(1, int(360 // width_deg))
 
 
 def assign_zone(lon: float) -> str:
@@ -87,13 +177,8 @@ def assign_zone(lon: float) -> str:
 
 def load_ground_nodes() -> list[Candidate]:
     """Load ground nodes from JSON."""
-    print(f"Loading ground nodes from {GROUND_NODES_FILE}")
-
-    with open(GROUND_NODES_FILE) as f:
-        nodes = json.load(f)
-
     candidates = []
-    for node in nodes:
+    for node in iter_json_array(GROUND_NODES_FILE):
         lat = node.get("latitude")
         lon = node.get("longitude")
 
@@ -112,21 +197,13 @@ def load_ground_nodes() -> list[Candidate]:
             weather_score=node.get("weather_score"),
         ))
 
-    print(f"  Loaded {len(candidates)} ground nodes")
     return candidates
 
 
 def load_cable_landings() -> list[Candidate]:
     """Load cable landing points from JSON."""
-    print(f"Loading cable landings from {CABLE_LANDING_FILE}")
-
-    with open(CABLE_LANDING_FILE) as f:
-        data = json.load(f)
-
-    points = data.get("landing_points", data)
-
     candidates = []
-    for point in points:
+    for point in iter_json_array(CABLE_LANDING_FILE, "landing_points"):
         lat = point.get("latitude")
         lon = point.get("longitude")
 
@@ -144,7 +221,6 @@ def load_cable_landings() -> list[Candidate]:
             cables=point.get("cables", []),
         ))
 
-    print(f"  Loaded {len(candidates)} cable landings")
     return candidates
 
 
@@ -167,41 +243,75 @@ def deduplicate_candidates(candidates: list[Candidate], threshold_km: float) ->
     unique = []
     merged_count = 0
 
+    # Compare the haversine term directly; skips atan2/sqrt per pair
+    sin2_half_threshold = math.sin(threshold_km / (2 * EARTH_RADIUS_KM)) ** 2
+    # Latitude gap alone bounds the distance from below (R * dlat)
+    lat_threshold_rad = threshold_km / EARTH_RADIUS_KM
+
+    # Spatial hash of accepted uniques: cells are at least threshold_km
+    # across, so only the 3x3 neighbourhood of a candidate is checked.
+    cell_deg = math.degrees(lat_threshold_rad)
+    row_cells: dict[int, int] = {}
+    grid: dict[tuple[int, int], list[int]] = {}
+    # Geometry of accepted uniques as parallel lists (indexed like `unique`)
+    uniq_lat: list[float] = []
+    uniq_lon: list[float] = []
+    uniq_cos_lat: list[float] = []
+
+    def cell_col(row: int, lon: float) -> tuple[int, int]:
+        if row not in row_cells:
+            row_cells[row] = grid_lon_cells(row, cell_deg, threshold_km)
+        n_cols = row_cells[row]
+        return int((lon + 180.0) * n_cols / 360.0) % n_cols, n_cols
+
     for candidate in sorted_candidates:
-        # Check if near any existing unique candidate
-        found_match = False
-        for existing in unique:
-            dist = haversine_km(
-                candidate.latitude, candidate.longitude,
-                existing.latitude, existing.longitude
-            )
-
-            if dist < threshold_km:
-                # Merge into existing
-                found_match = True
-                merged_count += 1
-
-                # Track merged sources
-                if existing.merged_sources is None:
-                    existing.merged_sources = [existing.source]
-                existing.merged_sources.append(candidate.source)
-
-                # Merge cable info if existing doesn't have it
-                if existing.cable_count is None and candidate.cable_count:
-                    existing.cable_count = candidate.cable_count
-                    existing.cables = candidate.cables
-                elif existing.cable_count and candidate.cable_count:
-                    # Combine cable counts
-                    existing.cable_count = max(existing.cable_count, candidate.cable_count)
-
-                # Merge weather score if existing doesn't have it
-                if existing.weather_score is None and candidate.weather_score:
-                    existing.weather_score = candidate.weather_score
-
-                break
-
-        if not found_match:
-            unique.append(candidate)
+        # Check if near any existing unique candidate (earliest wins)
+        row = math.floor(candidate.latitude / cell_deg)
+        lat, lon, cos_lat = candidate._lat_rad, candidate._lon_rad, candidate._cos_lat
+        match_idx = len(unique)
+        for r in (row - 1, row, row + 1):
+            col, n_cols = cell_col(r, candidate.longitude)
+            for c in {(col - 1) % n_cols, col, (col + 1) % n_cols}:
+                for idx in grid.get((r, c), ()):
+                    if idx >= match_idx:
+                        break
+                    dlat = uniq_lat[idx] - lat
+                    if abs(dlat) >= lat_threshold_rad:
+                        continue
+                    s = math.sin(dlat / 2)
+                    t = math.sin((uniq_lon[idx] - lon) / 2)
+                    if s * s + cos_lat * uniq_cos_lat[idx] * t * t < sin2_half_threshold:
+                        match_idx = idx
+                        break
+        existing = unique[match_idx] if match_idx < len(unique) else None
+
+        if existing is not None:
+            # Merge into existing
+            merged_count += 1
+
+            # Track merged sources
+            if existing.merged_sources is None:
+                existing.merged_sources = [existing.source]
+            existing.merged_sources.append(candidate.source)
+
+            # Merge cable info if existing doesn't have it
+            if existing.cable_count is None and candidate.cable_count:
+                existing.cable_count = candidate.cable_count
+                existing.cables = candidate.cables
+            elif existing.cable_count and candidate.cable_count:
+                # Combine cable counts
+                existing.cable_count = max(existing.cable_count, candidate.cable_count)
+
+            # Merge weather score if existing doesn't have it
+            if existing.weather_score is None and candidate.weather_score:
+                existing.weather_score = candidate.weather_score
+            continue
+
+        grid.setdefault((row, cell_col(row, candidate.longitude)[0]), []).append(len(unique))
+        uniq_lat.append(lat)
+        uniq_lon.append(lon)
+        uniq_cos_lat.append(cos_lat)
+        unique.append(candidate)
 
     print(f"  Merged {merged_count} duplicates")
     print(f"  Unique candidates: {len(unique)}")
@@ -225,9 +335,19 @@ def main():
     print("Building Ground Station Candidate Set")
     print("=" * 60)
 
-    # Load both sources
-    ground_nodes = load_ground_nodes()
-    cable_landings = load_cable_landings()
+    generated = datetime.now(timezone.utc).isoformat()
+
+    # Load both sources (independent file reads, overlapped); progress is
+    # printed from here so the two loaders' output never interleaves
+    print(f"Loading ground nodes from {GROUND_NODES_FILE}")
+    print(f"Loading cable landings from {CABLE_LANDING_FILE}")
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        ground_future = pool.submit(load_ground_nodes)
+        cable_future = pool.submit(load_cable_landings)
+        ground_nodes = ground_future.result()
+        cable_landings = cable_future.result()
+    print(f"  Loaded {len(ground_nodes)} ground nodes")
+    print(f"  Loaded {len(cable_landings)} cable landings")
 
     # Combine
     all_candidates = ground_nodes + cable_landings
@@ -245,9 +365,9 @@ def main():
 
     # Write output
     output = {
-        "candidates": [asdict(c) for c in unique_candidates],
+        "candidates": [c.to_dict() for c in unique_candidates],
         "metadata": {
-            "generated": datetime.now(timezone.utc).isoformat(),
+            "generated": generated,
             "total_candidates": len(unique_candidates),
             "zone_distribution": zone_counts,
             "sources": {
@@ -258,8 +378,9 @@ def main():
         }
     }
 
+    # Tool-generated file: compact separators, no indentation
     with open(OUTPUT_FILE, "w") as f:
-        json.dump(output, f, indent=2)
+        json.dump(output, f, separators=(",", ":"))
 
     print(f"\nWrote {OUTPUT_FILE}")
     print(f"  {len(unique_candidates)} unique candidate locations")
@@ -18,6 +18,8 @@ import argparse
 from pathlib import Path
 from datetime import datetime
 
+# Rows per UNWIND statement
+UNWIND_BATCH_SIZE = 500
 
 # HALO constellation: 12 MEO satellites at 10,500km
 HALO_CONSTELLATION = [
@@ -35,135 +37,118 @@ HALO_CONSTELLATION = [
     {"id": "HALO-3-4", "name": "HALO-3-4", "plane": 3, "slot": 4, "altitude_km": 10500, "raan": 120, "phase": 270},
 ]
 
+# ISL topology: intra-plane ring (slot -> next slot) and inter-plane ring
+# (plane -> next plane, same slot)
+ISL_INTRA_PLANE_PAIRS = [
+    {"a": f"HALO-{plane}-{slot}", "b": f"HALO-{plane}-{slot % 4 + 1}"}
+    for plane in range(1, 4) for slot in range(1, 5)
+]
+ISL_INTER_PLANE_PAIRS = [
+    {"a": f"HALO-{plane}-{slot}", "b": f"HALO-{plane % 3 + 1}-{slot}"}
+    for plane in range(1, 4) for slot in range(1, 5)
+]
 
-def escape_cypher(s: str) -> str:
-    """Escape string for Cypher."""
-    if s is None:
-        return ""
-    return str(s).replace("\\", "\\\\").replace("'", "\\'").replace('"', '\\"')
+# Statement bodies applied to each UNWIND batch
+SATELLITE_CYPHER = "CREATE (x:Satellite) SET x = s, x.constellation = 'HALO', x.orbit_type = 'MEO';"
+GROUND_STATION_CYPHER = "CREATE (x:GroundStation) SET x = g;"
+ISL_CYPHER = """MATCH (s1:Satellite {{id: r.a}}), (s2:Satellite {{id: r.b}})
+CREATE (s1)-[:ISL {{type: '{type}', latency_ms: {latency_ms}, capacity_gbps: {capacity_gbps}}}]->(s2);"""
 
 
 def format_value(v) -> str:
-    """Format a value for Cypher."""
+    """Format a value as a Cypher literal (JSON escapes are valid Cypher)."""
     if v is None:
         return "null"
-    elif isinstance(v, bool):
-        return "true" if v else "false"
-    elif isinstance(v, (int, float)):
-        return str(v)
-    elif isinstance(v, list):
-        items = ", ".join(format_value(i) for i in v)
-        return f"[{items}]"
-    else:
-        return f"'{escape_cypher(str(v))}'"
+    return json.dumps(v, ensure_ascii=False)
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Export SX9-Orbital constellation to Cypher")
-    parser.add_argument("--stations-file", type=Path,
-                        default=Path(__file__).parent.parent / "data" / "selected_247_stations.json",
-                        help="Path to selected stations JSON")
-    parser.add_argument("--output", "-o", type=Path,
-                        default=Path(__file__).parent.parent / "data" / "orbital_constellation.cypher",
-                        help="Output Cypher file")
-    args = parser.parse_args()
+def cypher_map(d: dict) -> str:
+    """Format a dict as a Cypher map literal."""
+    items = ", ".join(f"{k}: {format_value(v)}" for k, v in d.items())
+    return f"{{{items}}}"
 
-    if not args.stations_file.exists():
-        print(f"ERROR: Stations file not found: {args.stations_file}")
-        return 1
 
-    with open(args.stations_file) as f:
-        data = json.load(f)
+def emit_unwind(emit, rows: list[dict], var: str, body: str):
+    """Emit rows as batched `UNWIND [...] AS var` statements sharing one body."""
+    for i in range(0, len(rows), UNWIND_BATCH_SIZE):
+        batch = rows[i:i + UNWIND_BATCH_SIZE]
+        emit("UNWIND [")
+        emit(",\n".join(f"  {cypher_map(r)}" for r in batch))
+        emit(f"] AS {var}")
+        emit(body)
 
-    selected = data.get("selected", [])
-    metadata = data.get("metadata", {})
 
-    lines = []
-    lines.append("// SX9-Orbital Constellation Graph Export")
-    lines.append(f"// Generated: {datetime.now().isoformat()}")
-    lines.append(f"// Total Stations: {len(selected)}")
-    lines.append(f"// Satellites: {len(HALO_CONSTELLATION)}")
-    lines.append("")
+def write_cypher(f, selected: list):
+    """Stream Cypher statements for the constellation to an open file."""
+    write = f.write
+
+    def emit(line: str = ""):
+        write(line)
+        write("\n")
+
+    emit("// SX9-Orbital Constellation Graph Export")
+    emit(f"// Generated: {datetime.now().isoformat()}")
+    emit(f"// Total Stations: {len(selected)}")
+    emit(f"// Satellites: {len(HALO_CONSTELLATION)}")
+    emit()
 
     # Clear existing data
-    lines.append("// === Clear existing orbital data ===")
-    lines.append("MATCH ()-[r:FSO_LINK|ISL|NEAR_CABLE]-() DELETE r;")
-    lines.append("MATCH (n) WHERE n:GroundStation OR n:Satellite DETACH DELETE n;")
-    lines.append("")
+    emit("// === Clear existing orbital data ===")
+    emit("MATCH ()-[r:FSO_LINK|ISL|NEAR_CABLE]-() DELETE r;")
+    emit("MATCH (n) WHERE n:GroundStation OR n:Satellite DETACH DELETE n;")
+    emit()
 
     # Create indexes
-    lines.append("// === Create indexes ===")
-    lines.append("CREATE INDEX IF NOT EXISTS FOR (g:GroundStation) ON (g.id);")
-    lines.append("CREATE INDEX IF NOT EXISTS FOR (g:GroundStation) ON (g.zone);")
-    lines.append("CREATE INDEX IF NOT EXISTS FOR (g:GroundStation) ON (g.country_code);")
-    lines.append("CREATE INDEX IF NOT EXISTS FOR (s:Satellite) ON (s.id);")
-    lines.append("CREATE INDEX IF NOT EXISTS FOR (s:Satellite) ON (s.plane);")
-    lines.append("")
+    emit("// === Create indexes ===")
+    emit("CREATE INDEX IF NOT EXISTS FOR (g:GroundStation) ON (g.id);")
+    emit("CREATE INDEX IF NOT EXISTS FOR (g:GroundStation) ON (g.zone);")
+    emit("CREATE INDEX IF NOT EXISTS FOR (g:GroundStation) ON (g.country_code);")
+    emit("CREATE INDEX IF NOT EXISTS FOR (s:Satellite) ON (s.id);")
+    emit("CREATE INDEX IF NOT EXISTS FOR (s:Satellite) ON (s.plane);")
+    emit()
 
     # Create satellites
-    lines.append("// === Create HALO Satellites ===")
-    for sat in HALO_CONSTELLATION:
-        lines.append(f"""CREATE (:Satellite {{
-  id: '{sat['id']}',
-  name: '{sat['name']}',
-  plane: {sat['plane']},
-  slot: {sat['slot']},
-  altitude_km: {sat['altitude_km']},
-  raan: {sat['raan']},
-  phase: {sat['phase']},
-  constellation: 'HALO',
-  orbit_type: 'MEO'
-}});""")
-    lines.append("")
+    emit("// === Create HALO Satellites ===")
+    emit_unwind(emit, HALO_CONSTELLATION, "s", SATELLITE_CYPHER)
+    emit()
 
     # Create ground stations
-    lines.append("// === Create Ground Stations ===")
+    emit("// === Create Ground Stations ===")
+    stations = []
     for entry in selected:
         c = entry.get("candidate", {})
-        lines.append(f"""CREATE (:GroundStation {{
-  id: {format_value(c.get('id'))},
-  name: {format_value(c.get('name'))},
-  latitude: {format_value(c.get('latitude'))},
-  longitude: {format_value(c.get('longitude'))},
-  zone: {format_value(c.get('zone'))},
-  source: {format_value(c.get('source'))},
-  tier: {format_value(c.get('tier'))},
-  demand_gbps: {format_value(c.get('demand_gbps'))},
-  weather_score: {format_value(c.get('weather_score'))},
-  country_code: {format_value(c.get('country_code'))},
-  security_score: {format_value(entry.get('security_score', c.get('security_score')))},
-  composite_score: {format_value(entry.get('score'))},
-  pop_score: {format_value(entry.get('pop_score'))},
-  xai_score: {format_value(entry.get('xai_score'))},
-  travel_advisory_level: {format_value(c.get('travel_advisory_level'))},
-  political_stability: {format_value(c.get('political_stability'))}
-}});""")
-    lines.append("")
+        stations.append({
+            "id": c.get("id"),
+            "name": c.get("name"),
+            "latitude": c.get("latitude"),
+            "longitude": c.get("longitude"),
+            "zone": c.get("zone"),
+            "source": c.get("source"),
+            "tier": c.get("tier"),
+            "demand_gbps": c.get("demand_gbps"),
+            "weather_score": c.get("weather_score"),
+            "country_code": c.get("country_code"),
+            "security_score": entry.get("security_score", c.get("security_score")),
+            "composite_score": entry.get("score"),
+            "pop_score": entry.get("pop_score"),
+            "xai_score": entry.get("xai_score"),
+            "travel_advisory_level": c.get("travel_advisory_level"),
+            "political_stability": c.get("political_stability"),
+        })
+    emit_unwind(emit, stations, "g", GROUND_STATION_CYPHER)
+    emit()
 
     # Create ISL links
-    lines.append("// === Create ISL Links ===")
-    # Intra-plane (adjacent slots)
-    for plane in range(1, 4):
-        for slot in range(1, 5):
-            next_slot = slot + 1 if slot < 4 else 1
-            s1 = f"HALO-{plane}-{slot}"
-            s2 = f"HALO-{plane}-{next_slot}"
-            lines.append(f"""MATCH (s1:Satellite {{id: '{s1}'}}), (s2:Satellite {{id: '{s2}'}})
-CREATE (s1)-[:ISL {{type: 'intra_plane', latency_ms: 35.0, capacity_gbps: 100.0}}]->(s2);""")
-
-    # Inter-plane (same slot, adjacent planes)
-    for plane in range(1, 4):
-        next_plane = plane + 1 if plane < 3 else 1
-        for slot in range(1, 5):
-            s1 = f"HALO-{plane}-{slot}"
-            s2 = f"HALO-{next_plane}-{slot}"
-            lines.append(f"""MATCH (s1:Satellite {{id: '{s1}'}}), (s2:Satellite {{id: '{s2}'}})
-CREATE (s1)-[:ISL {{type: 'inter_plane', latency_ms: 45.0, capacity_gbps: 80.0}}]->(s2);""")
-    lines.append("")
+    emit("// === Create ISL Links ===")
+    emit_unwind(emit, ISL_INTRA_PLANE_PAIRS, "r", ISL_CYPHER.format_map(
+        {"type": "intra_plane", "latency_ms": 35.0, "capacity_gbps": 100.0}))
+    emit_unwind(emit, ISL_INTER_PLANE_PAIRS, "r", ISL_CYPHER.format_map(
+        {"type": "inter_plane", "latency_ms": 45.0, "capacity_gbps": 80.0}))
+    emit()
 
     # Create FSO links
-    lines.append("// === Create FSO Links ===")
-    lines.append("""MATCH (g:GroundStation), (s:Satellite)
+    emit("// === Create FSO Links ===")
+    emit("""MATCH (g:GroundStation), (s:Satellite)
 CREATE (g)-[:FSO_LINK {
   weather_score: g.weather_score,
   margin_db: CASE
@@ -174,25 +159,45 @@ CREATE (g)-[:FSO_LINK {
   capacity_gbps: 10.0,
   link_type: 'ground_to_sat'
 }]->(s);""")
-    lines.append("")
+    emit()
 
     # Summary statistics queries
-    lines.append("// === Verification Queries ===")
-    lines.append("// Run these to verify the import:")
-    lines.append("// MATCH (g:GroundStation) RETURN count(g) as stations;")
-    lines.append("// MATCH (s:Satellite) RETURN count(s) as satellites;")
-    lines.append("// MATCH ()-[r:FSO_LINK]->() RETURN count(r) as fso_links;")
-    lines.append("// MATCH ()-[r:ISL]->() RETURN count(r) as isl_links;")
-    lines.append("")
-    lines.append("// Zone distribution:")
-    lines.append("// MATCH (g:GroundStation) RETURN g.zone, count(g) ORDER BY count(g) DESC;")
-    lines.append("")
-    lines.append("// Security distribution:")
-    lines.append("// MATCH (g:GroundStation) RETURN avg(g.security_score), min(g.security_score), max(g.security_score);")
-
-    # Write output
-    with open(args.output, "w") as f:
-        f.write("\n".join(lines))
+    emit("// === Verification Queries ===")
+    emit("// Run these to verify the import:")
+    emit("// MATCH (g:GroundStation) RETURN count(g) as stations;")
+    emit("// MATCH (s:Satellite) RETURN count(s) as satellites;")
+    emit("// MATCH ()-[r:FSO_LINK]->() RETURN count(r) as fso_links;")
+    emit("// MATCH ()-[r:ISL]->() RETURN count(r) as isl_links;")
+    emit()
+    emit("// Zone distribution:")
+    emit("// MATCH (g:GroundStation) RETURN g.zone, count(g) ORDER BY count(g) DESC;")
+    emit()
+    emit("// Security distribution:")
+    emit("// MATCH (g:GroundStation) RETURN avg(g.security_score), min(g.security_score), max(g.security_score);")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export SX9-Orbital constellation to Cypher")
+    parser.add_argument("--stations-file", type=Path,
+                        default=Path(__file__).parent.parent / "data" / "selected_247_stations.json",
+                        help="Path to selected stations JSON")
+    parser.add_argument("--output", "-o", type=Path,
+                        default=Path(__file__).parent.parent / "data" / "orbital_constellation.cypher",
+                        help="Output Cypher file")
+    args = parser.parse_args()
+
+    if not args.stations_file.exists():
+        print(f"ERROR: Stations file not found: {args.stations_file}")
+        return 1
+
+    with open(args.stations_file) as f:
+        data = json.load(f)
+
+    selected = data.get("selected", [])
+    metadata = data.get("metadata", {})
+
+    with open(args.output, "w", encoding="utf-8", buffering=1 << 20) as f:
+        write_cypher(f, selected)
 
     print(f"Exported {len(selected)} ground stations and {len(HALO_CONSTELLATION)} satellites")
     print(f"Output: {args.output}")
@@ -21,20 +21,39 @@ Usage:
   python export_satellite_subgraph.py                    # Export all formats
   python export_satellite_subgraph.py --format json      # JSON only
   python export_satellite_subgraph.py --from-neo4j       # Pull from live Neo4j
+  python export_satellite_subgraph.py --pretty           # Indented JSON (default: compact)
 """
 
 import json
 import math
+import functools
+import csv
 import argparse
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # HALO constellation parameters
 HALO_ALTITUDE_KM = 10500
 EARTH_RADIUS_KM = 6371
 SPEED_OF_LIGHT_KM_S = 299792.458
 
+# Chord length between two satellites on the HALO orbit, keyed by angular
+# separation in degrees (every separation the 3x4 geometry can produce)
+_ORBIT_RADIUS_KM = EARTH_RADIUS_KM + HALO_ALTITUDE_KM
+_CHORD_KM = {
+    deg: 2 * _ORBIT_RADIUS_KM * math.sin(math.radians(deg) / 2)
+    for deg in (0, 60, 90, 120, 180)
+}
+
 # Monte Carlo parameters
 MC_PARAMS = {
     # Satellite parameters
@@ -65,26 +84,78 @@ MC_PARAMS = {
     "debris_collision_prob_per_sat_per_year": 0.0001,
 }
 
+# GraphML fragments: fixed XML pre-encoded, per-element templates filled per row
+GRAPHML_HEADER = b"""<?xml version="1.0" encoding="UTF-8"?>
+<graphml xmlns="http://graphml.graphdrawing.org/xmlns">
+  <key id="plane" for="node" attr.name="plane" attr.type="int"/>
+  <key id="slot" for="node" attr.name="slot" attr.type="int"/>
+  <key id="altitude_km" for="node" attr.name="altitude_km" attr.type="double"/>
+  <key id="type" for="edge" attr.name="type" attr.type="string"/>
+  <key id="latency_ms" for="edge" attr.name="latency_ms" attr.type="double"/>
+  <key id="capacity_gbps" for="edge" attr.name="capacity_gbps" attr.type="double"/>
+  <key id="failure_prob" for="edge" attr.name="failure_prob" attr.type="double"/>
+  <graph id="HALO" edgedefault="directed">
+"""
+GRAPHML_NODE = """    <node id="{id}">
+      <data key="plane">{plane}</data>
+      <data key="slot">{slot}</data>
+      <data key="altitude_km">{altitude_km}</data>
+    </node>
+"""
+GRAPHML_EDGE = """    <edge id="e{i}" source="{source}" target="{target}">
+      <data key="type">{type}</data>
+      <data key="latency_ms">{latency_mean_ms}</data>
+      <data key="capacity_gbps">{capacity_gbps}</data>
+      <data key="failure_prob">{failure_prob_per_hour}</data>
+    </edge>
+"""
+GRAPHML_FOOTER = b"""  </graph>
+</graphml>
+"""
+
+RUST_CONST_TEMPLATE = """//! HALO Constellation ISL Network - Auto-generated
+//! Generated: {generated_at}
+
+/// Number of satellites in HALO constellation
+pub const NUM_SATELLITES: usize = {num_satellites};
+
+/// Number of ISL links
+pub const NUM_ISL_LINKS: usize = {num_isl_links};
+
+/// Satellite IDs indexed by (plane-1)*4 + (slot-1)
+pub const SATELLITE_IDS: [&str; NUM_SATELLITES] = [
+{sat_ids}
+];
+
+/// ISL edges as (source_idx, target_idx, latency_ms, capacity_gbps, failure_prob_per_hour)
+pub const ISL_EDGES: [(usize, usize, f64, f64, f64); NUM_ISL_LINKS] = [
+{isl_edges}
+];
+
+/// Monte Carlo simulation parameters
+pub mod mc_params {{
+    pub const SATELLITE_FAILURE_PROB_PER_YEAR: f64 = {satellite_failure_prob_per_year};
+    pub const SATELLITE_MTBF_HOURS: f64 = {satellite_mtbf_hours}.0;
+    pub const SOLAR_STORM_PROBABILITY: f64 = {solar_storm_probability};
+    pub const SOLAR_STORM_FAILURE_MULTIPLIER: f64 = {solar_storm_link_failure_increase};
+}}
+"""
+
 
 def calculate_isl_distance_km(plane1: int, slot1: int, plane2: int, slot2: int) -> float:
     """Calculate approximate ISL distance between two satellites."""
     # Simplified: assume circular orbits at same altitude
-    orbit_radius = EARTH_RADIUS_KM + HALO_ALTITUDE_KM
-
     if plane1 == plane2:
         # Intra-plane: angular separation based on slot difference
         slot_diff = min(abs(slot1 - slot2), 4 - abs(slot1 - slot2))
-        angle_rad = math.radians(slot_diff * 90)  # 90° between slots
+        angle_deg = slot_diff * 90  # 90° between slots
     else:
         # Inter-plane: angular separation based on RAAN difference
-        raan_diff = abs((plane1 - 1) * 60 - (plane2 - 1) * 60)  # 60° between planes
-        if raan_diff > 180:
-            raan_diff = 360 - raan_diff
-        angle_rad = math.radians(raan_diff)
+        angle_deg = abs((plane1 - 1) * 60 - (plane2 - 1) * 60)  # 60° between planes
+        if angle_deg > 180:
+            angle_deg = 360 - angle_deg
 
-    # Chord length formula
-    distance = 2 * orbit_radius * math.sin(angle_rad / 2)
-    return distance
+    return _CHORD_KM[angle_deg]
 
 
 def calculate_light_delay_ms(distance_km: float) -> float:
@@ -96,6 +167,7 @@ def build_halo_constellation() -> dict:
     """Build the HALO constellation graph structure."""
     satellites = []
     edges = []
+    adjacency = {}
 
     # Create satellites
     for plane in range(1, 4):
@@ -104,7 +176,7 @@ def build_halo_constellation() -> dict:
             phase = (slot - 1) * 90  # 0°, 90°, 180°, 270°
             sat_id = f"HALO-{plane}-{slot}"
 
-            satellites.append({
+            sat = {
                 "id": sat_id,
                 "plane": plane,
                 "slot": slot,
@@ -114,12 +186,17 @@ def build_halo_constellation() -> dict:
                 "orbit_type": "MEO",
                 "failure_prob_per_year": MC_PARAMS["satellite_failure_prob_per_year"],
                 "mtbf_hours": MC_PARAMS["satellite_mtbf_hours"],
-            })
+            }
+            satellites.append(sat)
+            adjacency[sat_id] = {"node": sat, "neighbors": []}
 
     # Create ISL edges
+    intra = MC_PARAMS["isl_intra_plane"]
+    inter = MC_PARAMS["isl_inter_plane"]
     for plane in range(1, 4):
         for slot in range(1, 5):
             sat_id = f"HALO-{plane}-{slot}"
+            neighbors = adjacency[sat_id]["neighbors"]
 
             # Intra-plane: connect to next slot (with wraparound)
             next_slot = slot + 1 if slot < 4 else 1
@@ -133,7 +210,14 @@ def build_halo_constellation() -> dict:
                 "type": "intra_plane",
                 "distance_km": round(distance, 2),
                 "light_delay_ms": round(light_delay, 2),
-                **MC_PARAMS["isl_intra_plane"],
+                **intra,
+            })
+            neighbors.append({
+                "target": neighbor_id,
+                "type": "intra_plane",
+                "latency_mean_ms": intra["latency_mean_ms"],
+                "capacity_gbps": intra["capacity_gbps"],
+                "failure_prob_per_hour": intra["failure_prob_per_hour"],
             })
 
             # Inter-plane: connect to same slot in next plane (with wraparound)
@@ -148,7 +232,14 @@ def build_halo_constellation() -> dict:
                 "type": "inter_plane",
                 "distance_km": round(distance, 2),
                 "light_delay_ms": round(light_delay, 2),
-                **MC_PARAMS["isl_inter_plane"],
+                **inter,
+            })
+            neighbors.append({
+                "target": neighbor_id,
+                "type": "inter_plane",
+                "latency_mean_ms": inter["latency_mean_ms"],
+                "capacity_gbps": inter["capacity_gbps"],
+                "failure_prob_per_hour": inter["failure_prob_per_hour"],
             })
 
     return {
@@ -162,158 +253,119 @@ def build_halo_constellation() -> dict:
         "mc_parameters": MC_PARAMS,
         "satellites": satellites,
         "isl_links": edges,
+        # Derived views (not serialized)
+        # Satellites are created in (plane, slot) order, so list position is the index
+        "_sat_to_idx": {sat["id"]: i for i, sat in enumerate(satellites)},
+        "_adjacency": adjacency,
     }
 
 
-def export_json(graph: dict, output_path: Path):
+_print_lock = threading.Lock()
+
+
+def log(message: str):
+    """Print a progress line; exporters may run concurrently."""
+    with _print_lock:
+        print(message)
+
+
+def public_view(graph: dict) -> dict:
+    """Graph without the derived, underscore-prefixed views."""
+    return {k: v for k, v in graph.items() if not k.startswith("_")}
+
+
+def write_json(obj, output_path: Path, pretty: bool = False):
+    """
+    Write obj as JSON, serialized with orjson when installed.
+    Compact by default; pretty=True indents by 2 for human reading.
+    """
+    if HAS_ORJSON:
+        with open(output_path, "wb", buffering=256 * 1024) as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0))
+    else:
+        with open(output_path, "w", buffering=256 * 1024) as f:
+            if pretty:
+                json.dump(obj, f, indent=2)
+            else:
+                json.dump(obj, f, separators=(",", ":"))
+
+
+def export_json(graph: dict, output_path: Path, pretty: bool = False):
     """Export graph as JSON."""
-    with open(output_path, "w") as f:
-        json.dump(graph, f, indent=2)
-    print(f"Exported JSON: {output_path}")
+    write_json(public_view(graph), output_path, pretty)
+    log(f"Exported JSON: {output_path}")
 
 
-def export_adjacency_list(graph: dict, output_path: Path):
+def export_adjacency_list(graph: dict, output_path: Path, pretty: bool = False):
     """Export as adjacency list for fast graph algorithms."""
-    adj = {}
-    for sat in graph["satellites"]:
-        adj[sat["id"]] = {
-            "node": sat,
-            "neighbors": []
-        }
-
-    for edge in graph["isl_links"]:
-        adj[edge["source"]]["neighbors"].append({
-            "target": edge["target"],
-            "type": edge["type"],
-            "latency_mean_ms": edge["latency_mean_ms"],
-            "capacity_gbps": edge["capacity_gbps"],
-            "failure_prob_per_hour": edge["failure_prob_per_hour"],
-        })
-
     output = {
         "format": "adjacency_list",
         "constellation": graph["constellation"],
         "generated_at": graph["generated_at"],
         "mc_parameters": graph["mc_parameters"],
-        "adjacency": adj,
+        "adjacency": graph["_adjacency"],
     }
 
-    with open(output_path, "w") as f:
-        json.dump(output, f, indent=2)
-    print(f"Exported adjacency list: {output_path}")
+    write_json(output, output_path, pretty)
+    log(f"Exported adjacency list: {output_path}")
 
 
 def export_edge_list(graph: dict, output_path: Path):
     """Export as simple edge list (CSV-like)."""
-    lines = [
-        "# HALO Constellation ISL Edge List",
-        f"# Generated: {graph['generated_at']}",
-        "# Format: source,target,type,latency_ms,capacity_gbps,failure_prob",
-        ""
-    ]
-
-    for edge in graph["isl_links"]:
-        lines.append(
-            f"{edge['source']},{edge['target']},{edge['type']},"
-            f"{edge['latency_mean_ms']},{edge['capacity_gbps']},"
-            f"{edge['failure_prob_per_hour']}"
+    with open(output_path, "w", newline="") as f:
+        f.write("# HALO Constellation ISL Edge List\n")
+        f.write(f"# Generated: {graph['generated_at']}\n")
+        f.write("# Format: source,target,type,latency_ms,capacity_gbps,failure_prob\n")
+        f.write("\n")
+        csv.writer(f, lineterminator="\n").writerows(
+            (edge["source"], edge["target"], edge["type"],
+             edge["latency_mean_ms"], edge["capacity_gbps"], edge["failure_prob_per_hour"])
+            for edge in graph["isl_links"]
         )
-
-    with open(output_path, "w") as f:
-        f.write("\n".join(lines))
-    print(f"Exported edge list: {output_path}")
+    log(f"Exported edge list: {output_path}")
 
 
 def export_graphml(graph: dict, output_path: Path):
     """Export as GraphML for NetworkX/igraph."""
-    lines = [
-        '<?xml version="1.0" encoding="UTF-8"?>',
-        '<graphml xmlns="http://graphml.graphdrawing.org/xmlns">',
-        '  <key id="plane" for="node" attr.name="plane" attr.type="int"/>',
-        '  <key id="slot" for="node" attr.name="slot" attr.type="int"/>',
-        '  <key id="altitude_km" for="node" attr.name="altitude_km" attr.type="double"/>',
-        '  <key id="type" for="edge" attr.name="type" attr.type="string"/>',
-        '  <key id="latency_ms" for="edge" attr.name="latency_ms" attr.type="double"/>',
-        '  <key id="capacity_gbps" for="edge" attr.name="capacity_gbps" attr.type="double"/>',
-        '  <key id="failure_prob" for="edge" attr.name="failure_prob" attr.type="double"/>',
-        '  <graph id="HALO" edgedefault="directed">',
-    ]
-
-    # Nodes
-    for sat in graph["satellites"]:
-        lines.append(f'    <node id="{sat["id"]}">')
-        lines.append(f'      <data key="plane">{sat["plane"]}</data>')
-        lines.append(f'      <data key="slot">{sat["slot"]}</data>')
-        lines.append(f'      <data key="altitude_km">{sat["altitude_km"]}</data>')
-        lines.append('    </node>')
-
-    # Edges
-    for i, edge in enumerate(graph["isl_links"]):
-        lines.append(f'    <edge id="e{i}" source="{edge["source"]}" target="{edge["target"]}">')
-        lines.append(f'      <data key="type">{edge["type"]}</data>')
-        lines.append(f'      <data key="latency_ms">{edge["latency_mean_ms"]}</data>')
-        lines.append(f'      <data key="capacity_gbps">{edge["capacity_gbps"]}</data>')
-        lines.append(f'      <data key="failure_prob">{edge["failure_prob_per_hour"]}</data>')
-        lines.append('    </edge>')
-
-    lines.append('  </graph>')
-    lines.append('</graphml>')
-
-    with open(output_path, "w") as f:
-        f.write("\n".join(lines))
-    print(f"Exported GraphML: {output_path}")
+    with open(output_path, "wb") as f:
+        w = f.write
+        w(GRAPHML_HEADER)
 
+        # Nodes
+        for sat in graph["satellites"]:
+            w(GRAPHML_NODE.format_map(sat).encode())
 
-def export_rust_const(graph: dict, output_path: Path):
-    """Export as Rust const arrays for embedded simulation."""
-    lines = [
-        "//! HALO Constellation ISL Network - Auto-generated",
-        f"//! Generated: {graph['generated_at']}",
-        "",
-        "/// Number of satellites in HALO constellation",
-        f"pub const NUM_SATELLITES: usize = {len(graph['satellites'])};",
-        "",
-        "/// Number of ISL links",
-        f"pub const NUM_ISL_LINKS: usize = {len(graph['isl_links'])};",
-        "",
-        "/// Satellite IDs indexed by (plane-1)*4 + (slot-1)",
-        "pub const SATELLITE_IDS: [&str; NUM_SATELLITES] = [",
-    ]
-    for sat in sorted(graph["satellites"], key=lambda s: (s["plane"], s["slot"])):
-        lines.append(f'    "{sat["id"]}",')
-    lines.append("];")
-    lines.append("")
-
-    # ISL adjacency as edge list
-    lines.append("/// ISL edges as (source_idx, target_idx, latency_ms, capacity_gbps, failure_prob_per_hour)")
-    lines.append("pub const ISL_EDGES: [(usize, usize, f64, f64, f64); NUM_ISL_LINKS] = [")
-
-    sat_to_idx = {sat["id"]: i for i, sat in enumerate(
-        sorted(graph["satellites"], key=lambda s: (s["plane"], s["slot"]))
-    )}
-
-    for edge in graph["isl_links"]:
-        src_idx = sat_to_idx[edge["source"]]
-        tgt_idx = sat_to_idx[edge["target"]]
-        lines.append(
-            f"    ({src_idx}, {tgt_idx}, {edge['latency_mean_ms']}, "
-            f"{edge['capacity_gbps']}, {edge['failure_prob_per_hour']}),  // {edge['source']} -> {edge['target']}"
-        )
-    lines.append("];")
-    lines.append("")
+        # Edges
+        for i, edge in enumerate(graph["isl_links"]):
+            w(GRAPHML_EDGE.format(i=i, **edge).encode())
 
-    # MC parameters
-    lines.append("/// Monte Carlo simulation parameters")
-    lines.append("pub mod mc_params {")
-    lines.append(f"    pub const SATELLITE_FAILURE_PROB_PER_YEAR: f64 = {MC_PARAMS['satellite_failure_prob_per_year']};")
-    lines.append(f"    pub const SATELLITE_MTBF_HOURS: f64 = {MC_PARAMS['satellite_mtbf_hours']}.0;")
-    lines.append(f"    pub const SOLAR_STORM_PROBABILITY: f64 = {MC_PARAMS['solar_storm_probability']};")
-    lines.append(f"    pub const SOLAR_STORM_FAILURE_MULTIPLIER: f64 = {MC_PARAMS['solar_storm_link_failure_increase']};")
-    lines.append("}")
+        w(GRAPHML_FOOTER)
+    log(f"Exported GraphML: {output_path}")
 
-    with open(output_path, "w") as f:
-        f.write("\n".join(lines))
-    print(f"Exported Rust const: {output_path}")
+
+def export_rust_const(graph: dict, output_path: Path):
+    """Export as Rust const arrays for embedded simulation."""
+    sat_to_idx = graph["_sat_to_idx"]
+
+    sat_ids = "\n".join(f'    "{sat["id"]}",' for sat in graph["satellites"])
+    isl_edges = "\n".join(
+        f"    ({sat_to_idx[edge['source']]}, {sat_to_idx[edge['target']]}, {edge['latency_mean_ms']}, "
+        f"{edge['capacity_gbps']}, {edge['failure_prob_per_hour']}),  // {edge['source']} -> {edge['target']}"
+        for edge in graph["isl_links"]
+    )
+
+    output_path.write_text(RUST_CONST_TEMPLATE.format(
+        generated_at=graph["generated_at"],
+        num_satellites=len(graph["satellites"]),
+        num_isl_links=len(graph["isl_links"]),
+        sat_ids=sat_ids,
+        isl_edges=isl_edges,
+        satellite_failure_prob_per_year=MC_PARAMS["satellite_failure_prob_per_year"],
+        satellite_mtbf_hours=MC_PARAMS["satellite_mtbf_hours"],
+        solar_storm_probability=MC_PARAMS["solar_storm_probability"],
+        solar_storm_link_failure_increase=MC_PARAMS["solar_storm_link_failure_increase"],
+    ))
+    log(f"Exported Rust const: {output_path}")
 
 
 def main():
@@ -325,6 +377,8 @@ def main():
                         default="all", help="Export format")
     parser.add_argument("--from-neo4j", action="store_true",
                         help="Pull satellite data from live Neo4j instead of building from scratch")
+    parser.add_argument("--pretty", action="store_true",
+                        help="Indent JSON output (default: compact)")
     args = parser.parse_args()
 
     args.output_dir.mkdir(parents=True, exist_ok=True)
@@ -339,21 +393,19 @@ def main():
     print(f"Altitude: {graph['altitude_km']} km")
     print("")
 
-    # Export in requested format(s)
-    if args.format in ("all", "json"):
-        export_json(graph, args.output_dir / "halo_isl_network.json")
-
-    if args.format in ("all", "adjacency"):
-        export_adjacency_list(graph, args.output_dir / "halo_isl_adjacency.json")
-
-    if args.format in ("all", "edgelist"):
-        export_edge_list(graph, args.output_dir / "halo_isl_edges.csv")
-
-    if args.format in ("all", "graphml"):
-        export_graphml(graph, args.output_dir / "halo_isl_network.graphml")
-
-    if args.format in ("all", "rust"):
-        export_rust_const(graph, args.output_dir / "halo_constellation.rs")
+    # Export in requested format(s); writers are independent, so run them concurrently
+    exporters = {
+        "json": (functools.partial(export_json, pretty=args.pretty), "halo_isl_network.json"),
+        "adjacency": (functools.partial(export_adjacency_list, pretty=args.pretty), "halo_isl_adjacency.json"),
+        "edgelist": (export_edge_list, "halo_isl_edges.csv"),
+        "graphml": (export_graphml, "halo_isl_network.graphml"),
+        "rust": (export_rust_const, "halo_constellation.rs"),
+    }
+    tasks = [task for fmt, task in exporters.items() if args.format in ("all", fmt)]
+    with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
+        futures = [pool.submit(export, graph, args.output_dir / filename) for export, filename in tasks]
+        for future in futures:
+            future.result()
 
     print("\nMonte Carlo parameters included:")
     print(f"  - Satellite failure prob: {MC_PARAMS['satellite_failure_prob_per_year']*100:.1f}%/year")
@@ -9,16 +9,39 @@ Usage:
     python fetch_ixp_locations.py
     python fetch_ixp_locations.py --output data/ixp_locations.json
     python fetch_ixp_locations.py --geocode-cables  # Also fix cable landing points
+    python fetch_ixp_locations.py --pretty          # Indented JSON (default: compact)
 """
 
 import json
-import requests
+import os
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from bisect import bisect_right
+from heapq import nlargest
+from itertools import accumulate
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional
-from dataclasses import dataclass, asdict
+from typing import TYPE_CHECKING, Optional
+from dataclasses import dataclass
 from datetime import datetime, timezone
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+# requests (and requests-cache) are imported where used, so --help and the
+# offline helpers don't pay their import cost
+if TYPE_CHECKING:
+    import requests
+
 # PeeringDB API endpoints
 PEERINGDB_BASE = "https://www.peeringdb.com/api"
 IXP_ENDPOINT = f"{PEERINGDB_BASE}/ix"
@@ -28,8 +51,12 @@ FAC_ENDPOINT = f"{PEERINGDB_BASE}/fac"
 DEFAULT_OUTPUT = Path(__file__).parent.parent / "data" / "ixp_locations.json"
 CABLE_LANDING_FILE = Path(__file__).parent.parent / "data" / "cable-infrastructure" / "cable_landing_points.json"
 
+# HTTP cache for PeeringDB responses (used when requests-cache is installed)
+CACHE_NAME = "peeringdb"
+CACHE_EXPIRE_SECONDS = 3600
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IXPLocation:
     """Minimal IXP location for orbital planning"""
     id: int
@@ -42,7 +69,7 @@ class IXPLocation:
     source: str = "peeringdb-ix"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FacilityLocation:
     """Minimal facility location for orbital planning"""
     id: int
@@ -56,84 +83,123 @@ class FacilityLocation:
     source: str = "peeringdb-fac"
 
 
-def fetch_ixp_locations() -> list[IXPLocation]:
+def make_session() -> "requests.Session":
+    """
+    Create a keep-alive HTTP session for PeeringDB.
+    With requests-cache installed, responses are cached in the user cache
+    directory and revalidated via ETag once stale. Caching replaces ijson
+    streaming of the facility download (see iter_response_records).
+    """
+    try:
+        import requests_cache
+        session = requests_cache.CachedSession(
+            CACHE_NAME, backend="sqlite", use_cache_dir=True, expire_after=CACHE_EXPIRE_SECONDS,
+        )
+    except ImportError:
+        import requests
+        session = requests.Session()
+    session.headers["Accept-Encoding"] = "gzip, deflate"
+    return session
+
+
+def load_response_json(resp) -> dict:
+    """Parse an HTTP JSON body, with orjson when installed."""
+    return orjson.loads(resp.content) if HAS_ORJSON else resp.json()
+
+
+def iter_response_records(resp):
+    """
+    Yield the records under "data" of a streamed PeeringDB response,
+    parsing incrementally with ijson when installed.
+
+    Streaming is deliberately disabled under requests-cache: a CachedSession
+    reads every body into memory to store it, even on a cache miss
+    (from_cache False), leaving the raw stream spent. Any response carrying
+    from_cache is therefore parsed whole, and only plain requests sessions
+    stream through ijson.
+    """
+    if HAS_IJSON and not hasattr(resp, "from_cache"):
+        resp.raw.decode_content = True  # Undo gzip transfer encoding
+        yield from ijson.items(resp.raw, "data.item", use_float=True)
+    else:
+        yield from load_response_json(resp).get("data", [])
+
+
+def fetch_ixp_locations(session: Optional["requests.Session"] = None) -> list[IXPLocation]:
     """Fetch IXP locations from PeeringDB"""
+    import requests
+
     print("Fetching IXP data from PeeringDB...")
 
     try:
-        resp = requests.get(IXP_ENDPOINT, timeout=60)
+        resp = (session or requests).get(IXP_ENDPOINT, timeout=60)
         resp.raise_for_status()
-        data = resp.json()
+        data = load_response_json(resp)
     except Exception as e:
         print(f"  ERROR fetching IXPs: {e}")
         return []
 
     ixps = []
     for ix in data.get("data", []):
+        get = ix.get
         # Skip if no location data
-        city = ix.get("city", "")
-        country = ix.get("country", "")
+        city = get("city", "")
+        country = get("country", "")
         if not city or not country:
             continue
 
+        # Positional args: (id, name, city, country, latitude, longitude, net_count);
+        # IXPs don't have direct lat/lon
         ixps.append(IXPLocation(
-            id=ix.get("id", 0),
-            name=ix.get("name", ""),
-            city=city,
-            country=country,
-            latitude=None,  # IXPs don't have direct lat/lon
-            longitude=None,
-            net_count=ix.get("net_count", 0),
+            get("id", 0), get("name", ""), city, country, None, None, get("net_count", 0),
         ))
 
     print(f"  Found {len(ixps)} IXPs with location data")
     return ixps
 
 
-def fetch_facility_locations(min_networks: int = 5) -> list[FacilityLocation]:
+def fetch_facility_locations(min_networks: int = 5,
+                             session: Optional["requests.Session"] = None) -> list[FacilityLocation]:
     """
     Fetch facility locations from PeeringDB.
     Only returns facilities with coordinates and minimum network count.
     """
-    print(f"Fetching facility data (min {min_networks} networks)...")
+    import requests
 
-    try:
-        resp = requests.get(FAC_ENDPOINT, timeout=120)
-        resp.raise_for_status()
-        data = resp.json()
-    except Exception as e:
-        print(f"  ERROR fetching facilities: {e}")
-        return []
+    print(f"Fetching facility data (min {min_networks} networks)...")
 
     facilities = []
     skipped_no_coords = 0
     skipped_low_networks = 0
 
-    for fac in data.get("data", []):
-        lat = fac.get("latitude")
-        lon = fac.get("longitude")
-        net_count = fac.get("net_count", 0)
-
-        # Skip facilities without coordinates
-        if lat is None or lon is None:
-            skipped_no_coords += 1
-            continue
-
-        # Skip low-importance facilities
-        if net_count < min_networks:
-            skipped_low_networks += 1
-            continue
-
-        facilities.append(FacilityLocation(
-            id=fac.get("id", 0),
-            name=fac.get("name", ""),
-            city=fac.get("city", ""),
-            country=fac.get("country", ""),
-            latitude=float(lat),
-            longitude=float(lon),
-            net_count=net_count,
-            ix_count=fac.get("ix_count", 0),
-        ))
+    try:
+        with (session or requests).get(FAC_ENDPOINT, stream=True, timeout=120) as resp:
+            resp.raise_for_status()
+
+            for fac in iter_response_records(resp):
+                get = fac.get
+                lat = get("latitude")
+                lon = get("longitude")
+
+                # Skip facilities without coordinates
+                if lat is None or lon is None:
+                    skipped_no_coords += 1
+                    continue
+
+                # Skip low-importance facilities
+                net_count = get("net_count", 0)
+                if net_count < min_networks:
+                    skipped_low_networks += 1
+                    continue
+
+                # Positional args: (id, name, city, country, latitude, longitude, net_count, ix_count)
+                facilities.append(FacilityLocation(
+                    get("id", 0), get("name", ""), get("city", ""), get("country", ""),
+                    float(lat), float(lon), net_count, get("ix_count", 0),
+                ))
+    except Exception as e:
+        print(f"  ERROR fetching facilities: {e}")
+        return []
 
     print(f"  Found {len(facilities)} facilities with coordinates")
     print(f"  Skipped: {skipped_no_coords} no coords, {skipped_low_networks} low networks")
@@ -145,14 +211,17 @@ def build_city_lookup(facilities: list[FacilityLocation]) -> dict[str, tuple[flo
     Build city -> (lat, lon) lookup from facilities.
     Uses the facility with most networks as the canonical location.
     """
-    city_best: dict[str, FacilityLocation] = {}
+    lookup: dict[str, tuple[float, float]] = {}
+    best_net_count: dict[str, int] = {}
 
     for fac in facilities:
-        key = f"{fac.city.lower()}, {fac.country.lower()}"
-        if key not in city_best or fac.net_count > city_best[key].net_count:
-            city_best[key] = fac
+        # PeeringDB may return null for city or country
+        key = f"{(fac.city or '').lower()}, {(fac.country or '').lower()}"
+        if key not in best_net_count or fac.net_count > best_net_count[key]:
+            best_net_count[key] = fac.net_count
+            lookup[key] = (fac.latitude, fac.longitude)
 
-    return {k: (v.latitude, v.longitude) for k, v in city_best.items()}
+    return lookup
 
 
 def geocode_cable_landing_points(city_lookup: dict[str, tuple[float, float]]) -> int:
@@ -166,12 +235,22 @@ def geocode_cable_landing_points(city_lookup: dict[str, tuple[float, float]]) ->
 
     print(f"Geocoding cable landing points...")
 
-    with open(CABLE_LANDING_FILE) as f:
-        cable_data = json.load(f)
+    if HAS_ORJSON:
+        cable_data = orjson.loads(CABLE_LANDING_FILE.read_bytes())
+    else:
+        with open(CABLE_LANDING_FILE) as f:
+            cable_data = json.load(f)
 
     updated = 0
     landing_points = cable_data.get("landing_points", [])
 
+    # Fuzzy matching searches all lookup keys at once: keys are joined with
+    # NUL separators so `city_part in key` (first key in order) becomes one
+    # str.find, and bisect maps the hit offset back to its key.
+    lookup_keys = list(city_lookup)
+    haystack = "\0".join(lookup_keys)
+    key_starts = list(accumulate((len(k) + 1 for k in lookup_keys[:-1]), initial=0))
+
     for point in landing_points:
         if point.get("coords_valid"):
             continue
@@ -180,8 +259,10 @@ def geocode_cable_landing_points(city_lookup: dict[str, tuple[float, float]]) ->
         name = point.get("name", "").lower()
         country = point.get("country", "").lower()
 
+        city_part = name.split(",", 1)[0].strip()
+
         # Try exact match first
-        key = f"{name.split(',')[0].strip()}, {country}"
+        key = f"{city_part}, {country}"
         if key in city_lookup:
             lat, lon = city_lookup[key]
             point["latitude"] = lat
@@ -192,19 +273,23 @@ def geocode_cable_landing_points(city_lookup: dict[str, tuple[float, float]]) ->
             continue
 
         # Try city name variations
-        city_part = name.split(",")[0].strip()
-        for lookup_key, coords in city_lookup.items():
-            if city_part in lookup_key:
-                point["latitude"] = coords[0]
-                point["longitude"] = coords[1]
-                point["coords_valid"] = True
-                point["coord_source"] = "peeringdb-facility-fuzzy"
-                updated += 1
-                break
+        pos = haystack.find(city_part) if lookup_keys else -1
+        if pos >= 0:
+            coords = city_lookup[lookup_keys[bisect_right(key_starts, pos) - 1]]
+            point["latitude"] = coords[0]
+            point["longitude"] = coords[1]
+            point["coords_valid"] = True
+            point["coord_source"] = "peeringdb-facility-fuzzy"
+            updated += 1
 
     if updated > 0:
-        with open(CABLE_LANDING_FILE, "w") as f:
+        # Write a sibling file and rename over the original, so an
+        # interrupted run never leaves a truncated cable file behind. Written
+        # with json (not orjson) to keep the checked-in file's \uXXXX escapes
+        tmp_file = CABLE_LANDING_FILE.with_suffix(".json.tmp")
+        with open(tmp_file, "w") as f:
             json.dump(cable_data, f, indent=2)
+        os.replace(tmp_file, CABLE_LANDING_FILE)
         print(f"  Updated {updated} cable landing points")
     else:
         print(f"  No cable landing points updated")
@@ -212,15 +297,39 @@ def geocode_cable_landing_points(city_lookup: dict[str, tuple[float, float]]) ->
     return updated
 
 
-def to_geojson(facilities: list[FacilityLocation], ixps: list[IXPLocation]) -> dict:
-    """Convert to GeoJSON FeatureCollection"""
-    features = []
+def write_json(obj, output_path: Path, pretty: bool = False):
+    """
+    Write obj as JSON, serialized with orjson when installed.
+    Compact by default; pretty=True indents by 2 for human reading.
+    """
+    if HAS_ORJSON:
+        with open(output_path, "wb", buffering=256 * 1024) as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0))
+    else:
+        with open(output_path, "w", buffering=256 * 1024) as f:
+            if pretty:
+                json.dump(obj, f, indent=2)
+            else:
+                json.dump(obj, f, separators=(",", ":"))
+
 
+def facility_tier(net_count: int) -> int:
+    """Tier based on network count at the facility."""
+    if net_count >= 100:
+        return 1
+    if net_count >= 30:
+        return 2
+    return 3
+
+
+def to_geojson(facilities: list[FacilityLocation], ixps: list[IXPLocation]) -> dict:
+    """
+    Convert to GeoJSON FeatureCollection.
+    Facilities must have coordinates (fetch_facility_locations guarantees it).
+    """
     # Add facilities as points
-    for fac in facilities:
-        if fac.latitude is None or fac.longitude is None:
-            continue
-        features.append({
+    features = [
+        {
             "type": "Feature",
             "geometry": {
                 "type": "Point",
@@ -236,7 +345,9 @@ def to_geojson(facilities: list[FacilityLocation], ixps: list[IXPLocation]) -> d
                 "type": "facility",
                 "source": fac.source
             }
-        })
+        }
+        for fac in facilities
+    ]
 
     return {
         "type": "FeatureCollection",
@@ -254,26 +365,15 @@ def to_orbital_format(facilities: list[FacilityLocation]) -> list[dict]:
     """
     Convert to sx9-orbital ground node format.
     Compatible with all_ground_nodes_backup.json schema.
+    Facilities must have coordinates (fetch_facility_locations guarantees it).
     """
-    nodes = []
-    for fac in facilities:
-        if fac.latitude is None or fac.longitude is None:
-            continue
-
-        # Calculate tier based on network count
-        if fac.net_count >= 100:
-            tier = 1
-        elif fac.net_count >= 30:
-            tier = 2
-        else:
-            tier = 3
-
-        nodes.append({
+    return [
+        {
             "id": f"pdb-fac-{fac.id}",
             "name": fac.name,
             "latitude": fac.latitude,
             "longitude": fac.longitude,
-            "tier": tier,
+            "tier": facility_tier(fac.net_count),
             "demand_gbps": min(fac.net_count * 0.5, 100),  # Estimate
             "weather_score": 0.85,  # Default, needs weather API
             "status": "reference",  # Not operational, just reference data
@@ -283,9 +383,9 @@ def to_orbital_format(facilities: list[FacilityLocation]) -> list[dict]:
             "ix_count": fac.ix_count,
             "city": fac.city,
             "country": fac.country
-        })
-
-    return nodes
+        }
+        for fac in facilities
+    ]
 
 
 def main():
@@ -298,15 +398,20 @@ def main():
                         help="Minimum networks for facility inclusion")
     parser.add_argument("--geocode-cables", action="store_true",
                         help="Also update cable landing points with coordinates")
+    parser.add_argument("--pretty", action="store_true",
+                        help="Indent JSON output (default: compact)")
     args = parser.parse_args()
 
     print("=" * 60)
     print("PeeringDB Location Fetcher for SX9-Orbital")
     print("=" * 60)
 
-    # Fetch data
-    ixps = fetch_ixp_locations()
-    facilities = fetch_facility_locations(min_networks=args.min_networks)
+    # Fetch data (independent network requests, overlapped)
+    with make_session() as session, ThreadPoolExecutor(max_workers=2) as pool:
+        ixp_future = pool.submit(fetch_ixp_locations, session)
+        fac_future = pool.submit(fetch_facility_locations, args.min_networks, session)
+        ixps = ixp_future.result()
+        facilities = fac_future.result()
 
     if not facilities:
         print("ERROR: No facility data retrieved")
@@ -324,8 +429,7 @@ def main():
     if args.format in ("geojson", "both"):
         geojson_file = args.output.with_suffix(".geojson")
         geojson = to_geojson(facilities, ixps)
-        with open(geojson_file, "w") as f:
-            json.dump(geojson, f, indent=2)
+        write_json(geojson, geojson_file, args.pretty)
         print(f"\nWrote GeoJSON: {geojson_file}")
         print(f"  {len(geojson['features'])} features")
 
@@ -340,8 +444,7 @@ def main():
                 "count": len(nodes)
             }
         }
-        with open(orbital_file, "w") as f:
-            json.dump(output, f, indent=2)
+        write_json(output, orbital_file, args.pretty)
         print(f"\nWrote orbital format: {orbital_file}")
         print(f"  {len(nodes)} ground nodes")
 
@@ -353,7 +456,7 @@ def main():
     print(f"  Facilities: {len(facilities)} (with coords, ≥{args.min_networks} networks)")
 
     # Top facilities by network count
-    top = sorted(facilities, key=lambda x: x.net_count, reverse=True)[:10]
+    top = nlargest(10, facilities, key=attrgetter("net_count"))
     print(f"\n  Top 10 facilities by network count:")
     for fac in top:
         print(f"    {fac.net_count:4d} nets | {fac.name[:40]:<40} | {fac.city}, {fac.country}")
@@ -20,17 +20,23 @@ Neo4j Connection:
   - Auth: Set NEO4J_PASSWORD environment variable
 
 Usage:
-  python load_neo4j_orbital.py                    # Load all data
+  python load_neo4j_orbital.py                    # Load all data (re-runs update in place)
   python load_neo4j_orbital.py --stations-only    # Load only ground stations
   python load_neo4j_orbital.py --clear            # Clear existing orbital data first
+  python load_neo4j_orbital.py --admin-import     # Offline bulk import into a new database
 """
 
 import json
 import math
 import argparse
+import csv
 import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from datetime import datetime
+from typing import Optional
+from datetime import datetime, timezone
 
 try:
     from neo4j import GraphDatabase
@@ -39,6 +45,18 @@ except ImportError:
     HAS_NEO4J = False
     print("WARNING: neo4j driver not installed. Run: pip install neo4j")
 
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+# Rows per UNWIND batch for bulk node creation
+UNWIND_BATCH_SIZE = 10_000
+# Rows per UNWIND batch for relationship creation (two lookups per row)
+RELATIONSHIP_BATCH_SIZE = 5_000
+# Concurrent write transactions for relationship batches (one session each)
+RELATIONSHIP_WORKERS = 8
 
 # HALO constellation: 12 MEO satellites at 10,500km
 # 3 planes, 4 satellites per plane, 90° spacing
@@ -59,6 +77,7 @@ HALO_CONSTELLATION = [
     {"id": "HALO-3-3", "name": "HALO-3-3", "plane": 3, "slot": 3, "altitude_km": 10500, "raan": 120, "phase": 180},
     {"id": "HALO-3-4", "name": "HALO-3-4", "plane": 3, "slot": 4, "altitude_km": 10500, "raan": 120, "phase": 270},
 ]
+HALO_SATELLITE_IDS = [sat["id"] for sat in HALO_CONSTELLATION]
 
 
 def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
@@ -75,286 +94,445 @@ def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     return R * c
 
 
+def station_row(entry: dict) -> dict:
+    """GroundStation properties from one selected-stations entry."""
+    candidate = entry.get("candidate", {})
+    return {
+        "id": candidate.get("id", ""),
+        "name": candidate.get("name", ""),
+        "latitude": candidate.get("latitude", 0),
+        "longitude": candidate.get("longitude", 0),
+        "zone": candidate.get("zone", ""),
+        "source": candidate.get("source", ""),
+        "tier": candidate.get("tier"),
+        "demand_gbps": candidate.get("demand_gbps"),
+        "weather_score": candidate.get("weather_score"),
+        "country_code": candidate.get("country_code"),
+        "travel_advisory_level": candidate.get("travel_advisory_level"),
+        "political_stability": candidate.get("political_stability"),
+        "rule_of_law": candidate.get("rule_of_law"),
+        "corruption_control": candidate.get("corruption_control"),
+        "security_score": entry.get("security_score", candidate.get("security_score")),
+        "composite_score": entry.get("score", 0),
+        "pop_score": entry.get("pop_score", 0),
+        "pop_proximity_score": entry.get("pop_proximity_score", 0),
+        "xai_score": entry.get("xai_score", 0),
+        "network_score": entry.get("network_score", 0),
+    }
+
+
+def _iter_selected_entries(stations_file: Path):
+    """
+    Yield the raw "selected" entries of a stations file, streamed with
+    ijson when installed so they are never all held in memory at once.
+    """
+    if HAS_IJSON:
+        with open(stations_file, "rb") as f:
+            yield from ijson.items(f, "selected.item", use_float=True)
+        return
+
+    with open(stations_file) as f:
+        data = json.load(f)
+    yield from data.get("selected", [])
+
+
+def iter_station_rows(stations_file: Path):
+    """
+    Yield selected ground stations as flat GroundStation property maps.
+    Stations are merged on id, so entries without one are skipped (and
+    reported) rather than collapsed into a single node.
+    """
+    for row in map(station_row, _iter_selected_entries(stations_file)):
+        if not row["id"]:
+            print(f"  WARNING: Skipping station without id: {row['name'] or '<unnamed>'}")
+            continue
+        yield row
+
+
+def isl_links() -> list[dict]:
+    """
+    HALO ISL topology: intra-plane ring (slot -> next slot) and inter-plane
+    ring (plane -> next plane, same slot).
+    """
+    links = []
+    for plane in range(1, 4):
+        for slot in range(1, 5):
+            links.append({
+                "a": f"HALO-{plane}-{slot}", "b": f"HALO-{plane}-{slot % 4 + 1}",
+                "type": "intra_plane", "latency_ms": 35.0, "capacity_gbps": 100.0,
+            })
+    for plane in range(1, 4):
+        for slot in range(1, 5):
+            links.append({
+                "a": f"HALO-{plane}-{slot}", "b": f"HALO-{plane % 3 + 1}-{slot}",
+                "type": "inter_plane", "latency_ms": 45.0, "capacity_gbps": 80.0,
+            })
+    return links
+
+
+def fso_margin_db(weather_score: Optional[float]) -> float:
+    """FSO link margin from station weather score (unknown weather -> worst case)."""
+    if weather_score is None:
+        return 1.0
+    if weather_score > 0.9:
+        return 6.0
+    if weather_score > 0.7:
+        return 3.0
+    return 1.0
+
+
+# neo4j-admin import columns: (property, type); untyped columns are strings
+STATION_CSV_COLUMNS = [
+    ("id", "ID"), ("name", ""), ("latitude", "double"), ("longitude", "double"),
+    ("zone", ""), ("source", ""), ("tier", "int"), ("demand_gbps", "double"),
+    ("weather_score", "double"), ("country_code", ""), ("travel_advisory_level", "int"),
+    ("political_stability", "double"), ("rule_of_law", "double"), ("corruption_control", "double"),
+    ("security_score", "double"), ("composite_score", "double"), ("pop_score", "double"),
+    ("pop_proximity_score", "double"), ("xai_score", "double"), ("network_score", "double"),
+]
+SATELLITE_CSV_COLUMNS = [
+    ("id", "ID"), ("name", ""), ("plane", "int"), ("slot", "int"),
+    ("altitude_km", "int"), ("raan", "int"), ("phase", "int"),
+]
+
+
+def csv_header(columns: list[tuple[str, str]]) -> list[str]:
+    """neo4j-admin header row, e.g. ("latitude", "double") -> "latitude:double"."""
+    return [f"{name}:{kind}" if kind else name for name, kind in columns]
+
+
+def write_admin_import_csv(stations_file: Path, outdir: Path) -> list[str]:
+    """
+    Write node and relationship CSVs for `neo4j-admin database import full`.
+    Returns the --nodes/--relationships arguments that reference them.
+    """
+    outdir.mkdir(parents=True, exist_ok=True)
+    loaded_at = datetime.now(timezone.utc).isoformat()
+    stations = list(iter_station_rows(stations_file))
+
+    def write(name: str, header: list[str], rows) -> str:
+        header_path = outdir / f"{name}-header.csv"
+        data_path = outdir / f"{name}.csv"
+        with open(header_path, "w", newline="") as f:
+            csv.writer(f).writerow(header)
+        with open(data_path, "w", newline="", encoding="utf-8") as f:
+            # None -> empty field, which neo4j-admin leaves unset (like a null property)
+            csv.writer(f).writerows(("" if v is None else v for v in row) for row in rows)
+        return f"{header_path},{data_path}"
+
+    stations_files = write(
+        "stations",
+        csv_header(STATION_CSV_COLUMNS) + ["loaded_at:datetime"],
+        ([st[name] for name, _ in STATION_CSV_COLUMNS] + [loaded_at] for st in stations),
+    )
+    satellites_files = write(
+        "satellites",
+        csv_header(SATELLITE_CSV_COLUMNS) + ["constellation", "orbit_type", "loaded_at:datetime"],
+        ([sat[name] for name, _ in SATELLITE_CSV_COLUMNS] + ["HALO", "MEO", loaded_at]
+         for sat in HALO_CONSTELLATION),
+    )
+    isl_files = write(
+        "isl-rels",
+        [":START_ID", ":END_ID", "type", "latency_ms:double", "capacity_gbps:double"],
+        ([r["a"], r["b"], r["type"], r["latency_ms"], r["capacity_gbps"]] for r in isl_links()),
+    )
+    fso_files = write(
+        "fso-rels",
+        [":START_ID", ":END_ID", "weather_score:double", "margin_db:double", "capacity_gbps:double", "link_type"],
+        ([st["id"], sat["id"], st["weather_score"], fso_margin_db(st["weather_score"]), 10.0, "ground_to_sat"]
+         for st in stations for sat in HALO_CONSTELLATION),
+    )
+
+    print(f"Wrote {len(stations)} stations, {len(HALO_CONSTELLATION)} satellites and links to {outdir}")
+    return [
+        f"--nodes=GroundStation={stations_files}",
+        f"--nodes=Satellite={satellites_files}",
+        f"--relationships=ISL={isl_files}",
+        f"--relationships=FSO_LINK={fso_files}",
+    ]
+
+
+def run_admin_import(import_args: list[str], database: str, neo4j_admin: str = "neo4j-admin",
+                     overwrite: bool = False) -> int:
+    """
+    Bulk-load CSVs with the offline importer (bypasses the transaction layer).
+    The target database must be new, or stopped and overwritten with
+    overwrite=True (which replaces all of its data); neo4j-admin refuses to
+    import into an existing database otherwise.
+    """
+    cmd = [neo4j_admin, "database", "import", "full", *import_args]
+    if overwrite:
+        cmd.append("--overwrite-destination=true")
+    cmd.append(database)
+    print(f"Running: {' '.join(cmd)}")
+    try:
+        return subprocess.run(cmd).returncode
+    except FileNotFoundError:
+        print(f"ERROR: {neo4j_admin} not found; add it to PATH or pass --neo4j-admin")
+        return 1
+
+
+# Cypher statements are fixed strings with all variable data passed as
+# parameters, so the server compiles and caches a single plan for each statement.
+
+# Deletes commit in batches (server-side), bounding transaction memory.
+# CALL ... IN TRANSACTIONS only runs in an auto-commit transaction (session.run)
+CLEAR_RELATIONSHIPS_CYPHER = f"""
+    MATCH ()-[r:FSO_LINK|ISL|NEAR_CABLE]->()
+    CALL {{ WITH r DELETE r }} IN TRANSACTIONS OF {UNWIND_BATCH_SIZE} ROWS
+    RETURN count(*) as deleted_rels
+"""
+CLEAR_NODES_CYPHER = f"""
+    MATCH (n)
+    WHERE n:GroundStation OR n:Satellite OR n:CableLanding
+    CALL {{ WITH n DETACH DELETE n }} IN TRANSACTIONS OF {UNWIND_BATCH_SIZE} ROWS
+    RETURN count(*) as deleted_nodes
+"""
+
+# Databases loaded by earlier CREATE-based runs without --clear can hold the
+# same id on several nodes, which the uniqueness constraints would reject
+DUPLICATE_IDS_CYPHER = """
+    CALL {
+        MATCH (g:GroundStation)
+        WITH g.id AS id, count(*) AS copies WHERE copies > 1
+        RETURN count(id) AS duplicate_stations
+    }
+    CALL {
+        MATCH (s:Satellite)
+        WITH s.id AS id, count(*) AS copies WHERE copies > 1
+        RETURN count(id) AS duplicate_satellites
+    }
+    RETURN duplicate_stations, duplicate_satellites
+"""
+
+# Nodes and relationships are merged on their ids/endpoints, so re-running the
+# loader updates properties in place instead of duplicating the graph
+STATION_INSERT_CYPHER = """
+    UNWIND $rows AS row
+    MERGE (g:GroundStation {id: row.id})
+    ON CREATE SET g.loaded_at = $loaded_at
+    SET g += row
+"""
+SATELLITE_INSERT_CYPHER = """
+    UNWIND $sats AS sat
+    MERGE (s:Satellite {id: sat.id})
+    ON CREATE SET s.loaded_at = $loaded_at
+    SET s += sat, s.constellation = 'HALO', s.orbit_type = 'MEO'
+"""
+
+ISL_INSERT_CYPHER = """
+    UNWIND $links AS link
+    MATCH (s1:Satellite {id: link.a}), (s2:Satellite {id: link.b})
+    MERGE (s1)-[r:ISL]->(s2)
+    SET r.type = link.type,
+        r.latency_ms = link.latency_ms,
+        r.capacity_gbps = link.capacity_gbps
+    RETURN count(r) as created
+"""
+FSO_STATIONS_CYPHER = "MATCH (g:GroundStation) RETURN g.id AS id, g.weather_score AS weather_score"
+# HALO is fixed, so satellites are looked up once per batch and cross-joined
+# with the batch's stations (one GroundStation lookup per station, not per pair)
+FSO_INSERT_CYPHER = """
+    MATCH (s:Satellite) WHERE s.id IN $sat_ids
+    WITH collect(s) AS sats
+    UNWIND $stations AS st
+    MATCH (g:GroundStation {id: st.gid})
+    UNWIND sats AS s
+    MERGE (g)-[r:FSO_LINK]->(s)
+    SET r.weather_score = st.w,
+        r.margin_db = st.m,
+        r.capacity_gbps = 10.0,
+        r.link_type = 'ground_to_sat'
+    RETURN count(r) as created
+"""
+
+# Node/relationship counts and security score spread in one round-trip
+GRAPH_STATS_CYPHER = """
+    CALL { MATCH (g:GroundStation) RETURN count(g) AS ground_stations }
+    CALL { MATCH (s:Satellite) RETURN count(s) AS satellites }
+    CALL { MATCH ()-[r:FSO_LINK]->() RETURN count(r) AS fso_links }
+    CALL { MATCH ()-[r:ISL]->() RETURN count(r) AS isl_links }
+    CALL {
+        MATCH (g:GroundStation)
+        RETURN
+            avg(g.security_score) as avg_security,
+            min(g.security_score) as min_security,
+            max(g.security_score) as max_security
+    }
+    RETURN ground_stations, satellites, fso_links, isl_links,
+           avg_security, min_security, max_security
+"""
+ZONE_DISTRIBUTION_CYPHER = """
+    MATCH (g:GroundStation)
+    RETURN g.zone as zone, count(g) as count
+    ORDER BY count DESC
+"""
+
+
 class OrbitalNeo4jLoader:
     """Load orbital constellation graph to Neo4j."""
 
     def __init__(self, uri: str = "bolt://localhost:7687", user: str = "neo4j", password: str = None):
         if not HAS_NEO4J:
             raise RuntimeError("neo4j driver not installed. Run: pip install neo4j")
-        self.driver = GraphDatabase.driver(uri, auth=(user, password))
+        self.driver = GraphDatabase.driver(
+            uri,
+            auth=(user, password),
+            # Room for the main, satellite and FSO sessions plus every relationship worker
+            max_connection_pool_size=32,
+            connection_acquisition_timeout=60,
+            # All reads here return small result sets; pull them in one round-trip
+            fetch_size=-1,
+            keep_alive=True,
+        )
+        # Shared by every session so reads observe writes made on other sessions
+        self.bookmark_manager = GraphDatabase.bookmark_manager()
+
+    def session(self, **config):
+        """Open a session that is causally chained with the loader's other sessions."""
+        return self.driver.session(bookmark_manager=self.bookmark_manager, **config)
 
     def close(self):
         self.driver.close()
 
-    def clear_orbital_data(self):
+    def clear_orbital_data(self, session):
         """Clear all existing orbital constellation nodes and relationships."""
-        with self.driver.session() as session:
-            # Delete relationships first
-            result = session.run("""
-                MATCH ()-[r:FSO_LINK|ISL|NEAR_CABLE]-()
-                DELETE r
-                RETURN count(r) as deleted_rels
-            """)
-            rels = result.single()["deleted_rels"]
-
-            # Delete nodes
-            result = session.run("""
-                MATCH (n)
-                WHERE n:GroundStation OR n:Satellite OR n:CableLanding
-                DETACH DELETE n
-                RETURN count(n) as deleted_nodes
-            """)
-            nodes = result.single()["deleted_nodes"]
-
-            print(f"Cleared {nodes} nodes and {rels} relationships")
-
-    def create_indexes(self):
-        """Create indexes for optimal query performance."""
-        with self.driver.session() as session:
-            # Ground station indexes
-            session.run("CREATE INDEX IF NOT EXISTS FOR (g:GroundStation) ON (g.id)")
-            session.run("CREATE INDEX IF NOT EXISTS FOR (g:GroundStation) ON (g.zone)")
-            session.run("CREATE INDEX IF NOT EXISTS FOR (g:GroundStation) ON (g.country_code)")
-            session.run("CREATE INDEX IF NOT EXISTS FOR (g:GroundStation) ON (g.security_score)")
-
-            # Satellite indexes
-            session.run("CREATE INDEX IF NOT EXISTS FOR (s:Satellite) ON (s.id)")
-            session.run("CREATE INDEX IF NOT EXISTS FOR (s:Satellite) ON (s.plane)")
-
-            print("Created indexes")
-
-    def load_ground_stations(self, stations_file: Path) -> int:
+        # Delete relationships first
+        result = session.run(CLEAR_RELATIONSHIPS_CYPHER)
+        rels = result.single()["deleted_rels"]
+
+        # Delete nodes
+        result = session.run(CLEAR_NODES_CYPHER)
+        nodes = result.single()["deleted_nodes"]
+
+        print(f"Cleared {nodes} nodes and {rels} relationships")
+
+    def create_indexes(self, session) -> bool:
+        """
+        Create uniqueness constraints and indexes for optimal query performance.
+        Returns False, leaving the schema untouched, if duplicate ids would
+        prevent the constraints from being created.
+        """
+        record = session.run(DUPLICATE_IDS_CYPHER).single()
+        if record["duplicate_stations"] or record["duplicate_satellites"]:
+            print(f"ERROR: Found {record['duplicate_stations']} duplicated GroundStation ids "
+                  f"and {record['duplicate_satellites']} duplicated Satellite ids")
+            print("The graph was loaded more than once; re-run with --clear to reload it")
+            return False
+
+        # Plain id indexes from earlier runs would block the uniqueness
+        # constraints below, which bring their own backing index
+        result = session.run("""
+            SHOW INDEXES YIELD name, labelsOrTypes, properties, owningConstraint
+            WHERE owningConstraint IS NULL
+              AND labelsOrTypes IN [['GroundStation'], ['Satellite']]
+              AND properties = ['id']
+            RETURN name
+        """)
+        for name in [record["name"] for record in result]:
+            session.run(f"DROP INDEX `{name}` IF EXISTS")
+
+        # Ground station constraints and indexes
+        session.run("CREATE CONSTRAINT ground_station_id IF NOT EXISTS FOR (g:GroundStation) REQUIRE g.id IS UNIQUE")
+        session.run("CREATE INDEX IF NOT EXISTS FOR (g:GroundStation) ON (g.zone)")
+        session.run("CREATE INDEX IF NOT EXISTS FOR (g:GroundStation) ON (g.country_code)")
+        session.run("CREATE INDEX IF NOT EXISTS FOR (g:GroundStation) ON (g.security_score)")
+
+        # Satellite constraints and indexes
+        session.run("CREATE CONSTRAINT satellite_id IF NOT EXISTS FOR (s:Satellite) REQUIRE s.id IS UNIQUE")
+        session.run("CREATE CONSTRAINT satellite_plane_slot IF NOT EXISTS FOR (s:Satellite) REQUIRE (s.plane, s.slot) IS UNIQUE")
+        session.run("CREATE INDEX IF NOT EXISTS FOR (s:Satellite) ON (s.plane)")
+
+        print("Created constraints and indexes")
+        return True
+
+    def load_ground_stations(self, session, stations_file: Path) -> int:
         """Load selected ground stations from JSON."""
-        with open(stations_file) as f:
-            data = json.load(f)
+        rows = iter_station_rows(stations_file)
+        # Bound once as a parameter (the driver sends a zoned DateTime)
+        loaded_at = datetime.now(timezone.utc)
 
-        selected = data.get("selected", [])
         count = 0
+        # One UNWIND per batch instead of a round-trip per station
+        while batch := list(islice(rows, UNWIND_BATCH_SIZE)):
+            session.execute_write(lambda tx: tx.run(STATION_INSERT_CYPHER, rows=batch, loaded_at=loaded_at).consume())
+            count += len(batch)
 
-        with self.driver.session() as session:
-            for entry in selected:
-                candidate = entry.get("candidate", {})
-
-                # Create GroundStation node
-                session.run("""
-                    CREATE (g:GroundStation {
-                        id: $id,
-                        name: $name,
-                        latitude: $latitude,
-                        longitude: $longitude,
-                        zone: $zone,
-                        source: $source,
-                        tier: $tier,
-                        demand_gbps: $demand_gbps,
-                        weather_score: $weather_score,
-                        country_code: $country_code,
-                        travel_advisory_level: $travel_advisory_level,
-                        political_stability: $political_stability,
-                        rule_of_law: $rule_of_law,
-                        corruption_control: $corruption_control,
-                        security_score: $security_score,
-                        composite_score: $composite_score,
-                        pop_score: $pop_score,
-                        pop_proximity_score: $pop_proximity_score,
-                        xai_score: $xai_score,
-                        network_score: $network_score,
-                        loaded_at: datetime()
-                    })
-                """,
-                    id=candidate.get("id", ""),
-                    name=candidate.get("name", ""),
-                    latitude=candidate.get("latitude", 0),
-                    longitude=candidate.get("longitude", 0),
-                    zone=candidate.get("zone", ""),
-                    source=candidate.get("source", ""),
-                    tier=candidate.get("tier"),
-                    demand_gbps=candidate.get("demand_gbps"),
-                    weather_score=candidate.get("weather_score"),
-                    country_code=candidate.get("country_code"),
-                    travel_advisory_level=candidate.get("travel_advisory_level"),
-                    political_stability=candidate.get("political_stability"),
-                    rule_of_law=candidate.get("rule_of_law"),
-                    corruption_control=candidate.get("corruption_control"),
-                    security_score=entry.get("security_score", candidate.get("security_score")),
-                    composite_score=entry.get("score", 0),
-                    pop_score=entry.get("pop_score", 0),
-                    pop_proximity_score=entry.get("pop_proximity_score", 0),
-                    xai_score=entry.get("xai_score", 0),
-                    network_score=entry.get("network_score", 0),
-                )
-                count += 1
-
-                if count % 50 == 0:
-                    print(f"  Loaded {count} ground stations...")
+            if len(batch) == UNWIND_BATCH_SIZE:
+                print(f"  Loaded {count} ground stations...")
 
         print(f"Loaded {count} ground stations to Neo4j")
         return count
 
-    def load_satellites(self) -> int:
+    def load_satellites(self, session) -> int:
         """Load HALO constellation satellites."""
-        count = 0
+        loaded_at = datetime.now(timezone.utc)
 
-        with self.driver.session() as session:
-            for sat in HALO_CONSTELLATION:
-                session.run("""
-                    CREATE (s:Satellite {
-                        id: $id,
-                        name: $name,
-                        plane: $plane,
-                        slot: $slot,
-                        altitude_km: $altitude_km,
-                        raan: $raan,
-                        phase: $phase,
-                        constellation: 'HALO',
-                        orbit_type: 'MEO',
-                        loaded_at: datetime()
-                    })
-                """,
-                    id=sat["id"],
-                    name=sat["name"],
-                    plane=sat["plane"],
-                    slot=sat["slot"],
-                    altitude_km=sat["altitude_km"],
-                    raan=sat["raan"],
-                    phase=sat["phase"],
-                )
-                count += 1
+        session.execute_write(lambda tx: tx.run(SATELLITE_INSERT_CYPHER, sats=HALO_CONSTELLATION, loaded_at=loaded_at).consume())
 
+        count = len(HALO_CONSTELLATION)
         print(f"Loaded {count} satellites to Neo4j")
         return count
 
-    def create_isl_links(self) -> int:
+    def create_isl_links(self, session) -> int:
         """Create inter-satellite links (ISL) between adjacent satellites."""
-        count = 0
-
-        with self.driver.session() as session:
-            # Intra-plane ISLs (connect adjacent slots within same plane)
-            result = session.run("""
-                MATCH (s1:Satellite), (s2:Satellite)
-                WHERE s1.plane = s2.plane
-                  AND s2.slot = s1.slot + 1
-                CREATE (s1)-[r:ISL {
-                    type: 'intra_plane',
-                    latency_ms: 35.0,
-                    capacity_gbps: 100.0
-                }]->(s2)
-                RETURN count(r) as created
-            """)
-            count += result.single()["created"]
-
-            # Wrap-around ISL (slot 4 to slot 1 in same plane)
-            result = session.run("""
-                MATCH (s1:Satellite {slot: 4}), (s2:Satellite {slot: 1})
-                WHERE s1.plane = s2.plane
-                CREATE (s1)-[r:ISL {
-                    type: 'intra_plane',
-                    latency_ms: 35.0,
-                    capacity_gbps: 100.0
-                }]->(s2)
-                RETURN count(r) as created
-            """)
-            count += result.single()["created"]
-
-            # Inter-plane ISLs (connect satellites between adjacent planes)
-            result = session.run("""
-                MATCH (s1:Satellite), (s2:Satellite)
-                WHERE s1.plane + 1 = s2.plane
-                  AND s1.slot = s2.slot
-                CREATE (s1)-[r:ISL {
-                    type: 'inter_plane',
-                    latency_ms: 45.0,
-                    capacity_gbps: 80.0
-                }]->(s2)
-                RETURN count(r) as created
-            """)
-            count += result.single()["created"]
-
-            # Wrap-around inter-plane (plane 3 to plane 1)
-            result = session.run("""
-                MATCH (s1:Satellite {plane: 3}), (s2:Satellite {plane: 1})
-                WHERE s1.slot = s2.slot
-                CREATE (s1)-[r:ISL {
-                    type: 'inter_plane',
-                    latency_ms: 45.0,
-                    capacity_gbps: 80.0
-                }]->(s2)
-                RETURN count(r) as created
-            """)
-            count += result.single()["created"]
+        # Topology is fixed, so enumerate it here and match endpoints by id
+        count = session.execute_write(lambda tx: tx.run(ISL_INSERT_CYPHER, links=isl_links()).single()["created"])
 
         print(f"Created {count} ISL links")
         return count
 
-    def create_fso_links(self) -> int:
+    def create_fso_links(self, session) -> int:
         """Create FSO links between ground stations and satellites.
 
         Each ground station can connect to any satellite within line-of-sight.
         For MEO at 10,500km, most ground stations see multiple satellites.
         """
-        count = 0
-
-        with self.driver.session() as session:
-            # Create FSO links from each ground station to all satellites
-            # In reality, visibility depends on elevation angle, but we simplify
-            # by creating links to all satellites with weather-dependent margin
-            result = session.run("""
-                MATCH (g:GroundStation), (s:Satellite)
-                CREATE (g)-[r:FSO_LINK {
-                    weather_score: g.weather_score,
-                    margin_db: CASE
-                        WHEN g.weather_score > 0.9 THEN 6.0
-                        WHEN g.weather_score > 0.7 THEN 3.0
-                        ELSE 1.0
-                    END,
-                    capacity_gbps: 10.0,
-                    link_type: 'ground_to_sat'
-                }]->(s)
-                RETURN count(r) as created
-            """)
-            count = result.single()["created"]
+        # Create FSO links from each ground station to all satellites
+        # In reality, visibility depends on elevation angle, but we simplify
+        # by creating links to all satellites with weather-dependent margin,
+        # resolved once per station
+        stations = [
+            {"gid": r["id"], "w": r["weather_score"], "m": fso_margin_db(r["weather_score"])}
+            for r in session.run(FSO_STATIONS_CYPHER)
+        ]
+
+        # Batches are independent write transactions of ~RELATIONSHIP_BATCH_SIZE
+        # links; managed transactions retry if concurrent batches deadlock on
+        # shared satellite nodes
+        step = max(1, RELATIONSHIP_BATCH_SIZE // len(HALO_CONSTELLATION))
+        batches = [stations[i:i + step] for i in range(0, len(stations), step)]
+        with ThreadPoolExecutor(max_workers=RELATIONSHIP_WORKERS) as pool:
+            count = sum(pool.map(self._insert_fso_batch, batches))
 
         print(f"Created {count} FSO links")
         return count
 
-    def get_statistics(self) -> dict:
+    def _insert_fso_batch(self, stations: list[dict]) -> int:
+        """Link one batch of stations to every HALO satellite on a worker-owned session."""
+        with self.session() as session:
+            return session.execute_write(lambda tx: tx.run(
+                FSO_INSERT_CYPHER, stations=stations, sat_ids=HALO_SATELLITE_IDS,
+            ).single()["created"])
+
+    def get_statistics(self, session) -> dict:
         """Get graph statistics."""
-        stats = {}
-
-        with self.driver.session() as session:
-            # Node counts
-            result = session.run("MATCH (g:GroundStation) RETURN count(g) as count")
-            stats["ground_stations"] = result.single()["count"]
-
-            result = session.run("MATCH (s:Satellite) RETURN count(s) as count")
-            stats["satellites"] = result.single()["count"]
-
-            # Relationship counts
-            result = session.run("MATCH ()-[r:FSO_LINK]->() RETURN count(r) as count")
-            stats["fso_links"] = result.single()["count"]
-
-            result = session.run("MATCH ()-[r:ISL]->() RETURN count(r) as count")
-            stats["isl_links"] = result.single()["count"]
-
-            # Zone distribution
-            result = session.run("""
-                MATCH (g:GroundStation)
-                RETURN g.zone as zone, count(g) as count
-                ORDER BY count DESC
-            """)
-            stats["zones"] = {r["zone"]: r["count"] for r in result}
-
-            # Security score distribution
-            result = session.run("""
-                MATCH (g:GroundStation)
-                RETURN
-                    avg(g.security_score) as avg_security,
-                    min(g.security_score) as min_security,
-                    max(g.security_score) as max_security
-            """)
-            record = result.single()
-            stats["security_avg"] = record["avg_security"]
-            stats["security_min"] = record["min_security"]
-            stats["security_max"] = record["max_security"]
+        # Read transactions route to read replicas in a cluster; the shared
+        # bookmark manager still guarantees they see this run's writes
+        record = session.execute_read(lambda tx: tx.run(GRAPH_STATS_CYPHER).single())
+        stats = {
+            "ground_stations": record["ground_stations"],
+            "satellites": record["satellites"],
+            "fso_links": record["fso_links"],
+            "isl_links": record["isl_links"],
+            "security_avg": record["avg_security"],
+            "security_min": record["min_security"],
+            "security_max": record["max_security"],
+        }
+
+        # Zone distribution (one row per zone, so kept separate)
+        stats["zones"] = session.execute_read(
+            lambda tx: {r["zone"]: r["count"] for r in tx.run(ZONE_DISTRIBUTION_CYPHER)})
 
         return stats
 
@@ -370,39 +548,69 @@ def main():
     parser.add_argument("--stations-only", action="store_true", help="Load only ground stations")
     parser.add_argument("--clear", action="store_true", help="Clear existing orbital data first")
     parser.add_argument("--no-links", action="store_true", help="Skip creating FSO and ISL links")
+    parser.add_argument("--admin-import", action="store_true",
+                        help="Cold load via offline neo4j-admin CSV import (server stopped, new database)")
+    parser.add_argument("--import-dir", type=Path,
+                        default=Path(__file__).parent.parent / "data" / "neo4j-import",
+                        help="Staging directory for --admin-import CSVs")
+    parser.add_argument("--database",
+                        help="Target database for --admin-import (required; must be new unless --overwrite-destination)")
+    parser.add_argument("--overwrite-destination", action="store_true",
+                        help="Let --admin-import replace an existing, stopped database")
+    parser.add_argument("--neo4j-admin", default="neo4j-admin", help="Path to the neo4j-admin executable")
     args = parser.parse_args()
+    if args.admin_import and not args.database:
+        parser.error("--admin-import requires --database")
 
     if not args.stations_file.exists():
         print(f"ERROR: Stations file not found: {args.stations_file}")
         print("Run the candidate-selector first: cargo run -p candidate-selector")
         return 1
 
+    if args.admin_import:
+        print("\n=== Writing neo4j-admin import files ===")
+        import_args = write_admin_import_csv(args.stations_file, args.import_dir)
+        print("\n=== Running neo4j-admin import ===")
+        return run_admin_import(import_args, args.database, args.neo4j_admin, args.overwrite_destination)
+
     loader = OrbitalNeo4jLoader(args.uri, args.user, args.password)
 
     try:
-        if args.clear:
-            print("\n=== Clearing existing orbital data ===")
-            loader.clear_orbital_data()
-
-        print("\n=== Creating indexes ===")
-        loader.create_indexes()
-
-        print("\n=== Loading ground stations ===")
-        loader.load_ground_stations(args.stations_file)
-
-        if not args.stations_only:
-            print("\n=== Loading HALO satellites ===")
-            loader.load_satellites()
-
-            if not args.no_links:
-                print("\n=== Creating ISL links ===")
-                loader.create_isl_links()
-
-                print("\n=== Creating FSO links ===")
-                loader.create_fso_links()
+        # One session carries the serial phases; the concurrent satellite
+        # load gets its own, since a session must not be shared across threads
+        with loader.session() as session:
+            if args.clear:
+                print("\n=== Clearing existing orbital data ===")
+                loader.clear_orbital_data(session)
+
+            print("\n=== Creating constraints and indexes ===")
+            if not loader.create_indexes(session):
+                return 1
+
+            # Stations and satellites are independent node sets; overlap their writes
+            if args.stations_only:
+                print("\n=== Loading ground stations ===")
+                loader.load_ground_stations(session, args.stations_file)
+            else:
+                print("\n=== Loading ground stations and HALO satellites ===")
+                with loader.session() as satellite_session, ThreadPoolExecutor(max_workers=2) as pool:
+                    stations_future = pool.submit(loader.load_ground_stations, session, args.stations_file)
+                    satellites_future = pool.submit(loader.load_satellites, satellite_session)
+                    stations_future.result()
+                    satellites_future.result()
+
+                if not args.no_links:
+                    # ISL and FSO links are disjoint relationship sets; build them concurrently
+                    print("\n=== Creating ISL and FSO links ===")
+                    with loader.session() as fso_session, ThreadPoolExecutor(max_workers=2) as pool:
+                        isl_future = pool.submit(loader.create_isl_links, session)
+                        fso_future = pool.submit(loader.create_fso_links, fso_session)
+                        isl_future.result()
+                        fso_future.result()
+
+            print("\n=== Graph Statistics ===")
+            stats = loader.get_statistics(session)
 
-        print("\n=== Graph Statistics ===")
-        stats = loader.get_statistics()
         print(f"  Ground Stations: {stats['ground_stations']}")
         print(f"  Satellites: {stats['satellites']}")
         print(f"  FSO Links: {stats['fso_links']}")
@@ -0,0 +1,71 @@
+"""Tests for fetch_ixp_locations facility parsing."""
+
+import json
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import fetch_ixp_locations as fil  # noqa: E402
+
+
+class FakeResponse:
+    """In-memory stand-in for a requests-cache response."""
+
+    from_cache = False
+
+    def __init__(self, payload: dict):
+        self.content = json.dumps(payload).encode()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class FakeSession:
+    def __init__(self, payload: dict):
+        self.payload = payload
+
+    def get(self, url, **kwargs):
+        return FakeResponse(self.payload)
+
+
+def facility(id: int, city, country, lat: float, lon: float, net_count: int = 10) -> dict:
+    return {"id": id, "name": f"Fac {id}", "city": city, "country": country,
+            "latitude": lat, "longitude": lon, "net_count": net_count, "ix_count": 1}
+
+
+class NullCityTest(unittest.TestCase):
+    def test_null_city_does_not_drop_facilities(self):
+        session = FakeSession({"data": [
+            facility(1, None, "US", 40.7, -74.0),
+            facility(2, "Paris", None, 48.9, 2.3),
+            facility(3, "Tokyo", "JP", 35.7, 139.7),
+        ]})
+
+        facilities = fil.fetch_facility_locations(session=session)
+
+        self.assertEqual([f.id for f in facilities], [1, 2, 3])
+
+    def test_city_lookup_tolerates_null_city(self):
+        facilities = [
+            fil.FacilityLocation(1, "Fac 1", None, "US", 40.7, -74.0, 10, 1),
+            fil.FacilityLocation(2, "Fac 2", "Tokyo", "JP", 35.7, 139.7, 20, 1),
+        ]
+
+        lookup = fil.build_city_lookup(facilities)
+
+        self.assertEqual(lookup, {", us": (40.7, -74.0), "tokyo, jp": (35.7, 139.7)})
+
+
+if __name__ == "__main__":
+    unittest.main()